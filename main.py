@@ -1,8 +1,13 @@
-import json
+import atexit
 import os
-import re
+from bisect import bisect_left
+from operator import attrgetter
+from typing import BinaryIO
 
+import orjson
+from pydantic import TypeAdapter, ValidationError
 from tabulate import tabulate
+from wcwidth import wcswidth
 
 from models import ContactModel
 
@@ -21,9 +26,33 @@ class PhoneBook:
     _TABLE_HEADERS: list[str] = ['ID', 'Имя', 'Фамилия', 'Отчество', 'Организация', 'Рабочий телефон',
                                  'Личный телефон']
 
+    _TEXT_COLUMNS: list[int] = list(range(1, len(_TABLE_HEADERS)))
+
+    _SEARCH_FIELDS: dict[int, tuple[str, str]] = dict(enumerate(zip(_FIELD_TYPES, _TABLE_HEADERS), start=1))
+
+    _TOMBSTONE_KEYS: frozenset[str] = frozenset(('id', 'deleted'))
+
+    _CONTACT_ADAPTER: TypeAdapter = TypeAdapter(ContactModel)
+    _CONTACTS_ADAPTER: TypeAdapter = TypeAdapter(list[ContactModel])
+
+    _SEARCH_FIELDS_CHARS: frozenset[str] = frozenset('1234567,')
+
+    _INDEXED_FIELDS: tuple[str, ...] = ('first_name', 'last_name', 'middle_name', 'organization', 'work_phone',
+                                        'personal_phone')
+    _INDEXED_VALUES: attrgetter = attrgetter(*_INDEXED_FIELDS)
+
     def __init__(self, filename: str) -> None:
         self._filename: str = filename
+        self._journal_filename: str = f'{filename}.journal'
+        self._journal_file: BinaryIO | None = None
         self._entries: list[ContactModel] = []
+        self._by_id: dict[int, ContactModel] = {}
+        self._dirty: bool = False
+        self._search_index: dict[str, dict[str, set[int]]] = {field: {} for field in self._INDEXED_FIELDS}
+        self._row_cache: dict[int, list] = {}
+        self._page_cache: dict[tuple[int, int], str] = {}
+        self._page_frame: tuple[str, ...] | None = None
+        self._col_widths: list[int] | None = None
 
         self._load_contacts()
         self._next_id: int = self._get_next_id()
@@ -32,29 +61,116 @@ class PhoneBook:
         """
         Возвращает следующий доступный ID для нового контакта.
 
-        Если в записной книжке уже есть контакты, возвращает максимальный ID + 1.
+        Если в записной книжке уже есть контакты, возвращает максимальный ID + 1. Список контактов
+        отсортирован по ID, поэтому максимальный ID у последнего контакта.
         Если записная книжка пуста, возвращает 1.
         """
         if self._entries:
-            return max(contact.id for contact in self._entries) + 1
+            return self._entries[-1].id + 1
         return 1
 
-    def _print_tabulate(self, table_data: list) -> None:
-        print(tabulate(table_data, headers=self._TABLE_HEADERS, tablefmt='fancy_grid'))
+    def _get_table_row(self, contact: ContactModel) -> list:
+        """
+        Возвращает строку таблицы для контакта.
+
+        Строка строится при первом обращении и кешируется по ID контакта. При изменении или удалении
+        контакта запись в кеше сбрасывается. Пробелы по краям текстовых полей отбрасываются, как это
+        делает tabulate.
+        """
+        row: list | None = self._row_cache.get(contact.id)
+        if row is None:
+            row = self._row_cache[contact.id] = [cell.strip() if isinstance(cell, str) else cell
+                                                 for cell in contact.model_dump_table()]
+        return row
+
+    @staticmethod
+    def _get_cell_width(cell: int | str) -> int:
+        """
+        Возвращает ширину ячейки на экране.
+
+        Широкие символы (например, иероглифы и эмодзи) считаются по две позиции, как в tabulate.
+        """
+        return wcswidth(str(cell))
+
+    def _get_page_frame(self) -> tuple[str, ...]:
+        """
+        Возвращает строку заголовков и рамку таблицы для постраничного вывода.
+
+        Ширина каждого столбца считается по всем контактам при первом выводе страницы. При добавлении
+        и изменении контактов столбцы расширяются без повторного прохода по всем контактам, а если
+        удалённое или изменённое значение задавало ширину столбца, ширина пересчитывается заново.
+        """
+        if self._page_frame is None:
+            if self._col_widths is None:
+                self._col_widths = [self._get_cell_width(header) + 2 for header in self._TABLE_HEADERS]
+                for contact in self._entries:
+                    for index, cell in enumerate(self._get_table_row(contact)):
+                        self._col_widths[index] = max(self._col_widths[index], self._get_cell_width(cell))
+            widths: list[int] = self._col_widths
+
+            self._page_frame = (
+                '╒' + '╤'.join('═' * (width + 2) for width in widths) + '╕',
+                self._format_page_row(self._TABLE_HEADERS),
+                '╞' + '╪'.join('═' * (width + 2) for width in widths) + '╡',
+                '├' + '┼'.join('─' * (width + 2) for width in widths) + '┤',
+                '╘' + '╧'.join('═' * (width + 2) for width in widths) + '╛',
+            )
+        return self._page_frame
+
+    def _format_page_row(self, row: list) -> str:
+        """
+        Форматирует строку постраничной таблицы по текущей ширине столбцов.
 
-    def _validate_contact(self, contact: dict) -> bool:
+        ID выравнивается по правому краю, остальные поля по левому. Отступы считаются по ширине ячейки
+        на экране, а не по длине строки.
+        """
+        cells: list[str] = []
+        for index, (cell, width) in enumerate(zip(row, self._col_widths)):
+            text: str = str(cell)
+            padding: str = ' ' * (width - self._get_cell_width(text))
+            cells.append(padding + text if index == 0 else text + padding)
+        return '│ ' + ' │ '.join(cells) + ' │'
+
+    def _widen_columns(self, contact: ContactModel) -> None:
+        """
+        Расширяет столбцы постраничной таблицы, если поля контакта в них не помещаются.
+
+        Рамка таблицы сбрасывается только тогда, когда ширина какого-либо столбца действительно изменилась.
+        """
+        if self._col_widths is None:
+            return
+        for index, cell in enumerate(self._get_table_row(contact)):
+            cell_width: int = self._get_cell_width(cell)
+            if cell_width > self._col_widths[index]:
+                self._col_widths[index] = cell_width
+                self._page_frame = None
+
+    def _shrink_columns(self, contact: ContactModel) -> None:
         """
-        Проверяет валидность данных контакта.
+        Сбрасывает ширину столбцов постраничной таблицы, если её задавало какое-либо поле контакта.
 
-        Принимает словарь с данными контакта и проверяет, соответствуют ли они ожидаемым типам данных
-        и обязательным полям. Возвращает True, если данные валидны, и False в противном случае.
+        Вызывается перед удалением контакта или изменением его полей. Ширина столбцов будет заново
+        посчитана по всем контактам при следующем выводе страницы.
         """
-        if len(contact) != len(self._FIELD_TYPES):
-            return False
-        for contact_key, contact_value in contact.items():
-            if contact_key not in self._FIELD_TYPES or not isinstance(contact_value, self._FIELD_TYPES[contact_key]):
-                return False
-        return True
+        if self._col_widths is None:
+            return
+        for width, cell in zip(self._col_widths, self._get_table_row(contact)):
+            if self._get_cell_width(cell) == width:
+                self._col_widths = None
+                self._page_frame = None
+                return
+
+    def _render_page(self, table_data: list) -> str:
+        """
+        Отрисовывает страницу контактов в формате 'fancy_grid' без использования tabulate.
+        """
+        top, header, header_separator, row_separator, bottom = self._get_page_frame()
+        body: str = f'\n{row_separator}\n'.join(self._format_page_row(row) for row in table_data)
+        return '\n'.join(line for line in (top, header, header_separator, body, bottom) if line)
+
+    def _print_tabulate(self, table_data: list) -> None:
+        print(tabulate(table_data, headers=self._TABLE_HEADERS, tablefmt='fancy_grid',
+                       disable_numparse=self._TEXT_COLUMNS))
 
     def _sort_contacts(self) -> None:
         """
@@ -62,97 +178,188 @@ class PhoneBook:
 
         Изменяет порядок контактов в списке, сортируя их по возрастанию ID.
         """
-        self._entries.sort(key=lambda contact: contact.id)
+        self._entries.sort(key=attrgetter('id'))
 
-    def save_contact(self) -> None:
+    def _index_contact(self, contact: ContactModel) -> None:
         """
-        Сохраняет список контактов в файл 'self.filename'.
+        Добавляет контакт в поисковый индекс.
 
-        Преобразует список контактов в формат JSON и записывает его в файл из 'self.filename'.
+        Для каждого текстового поля запоминает ID контакта под значением поля в нижнем регистре,
+        чтобы поиск проверял каждое различное значение один раз и не приводил поля к нижнему регистру заново.
         """
-        with open(self._filename, 'w') as file:
-            contacts_json: list[dict] = [item.model_dump() for item in self._entries]
-            json.dump(contacts_json, file, indent=4)
+        for field, value in zip(self._INDEXED_FIELDS, self._INDEXED_VALUES(contact)):
+            self._search_index[field].setdefault(value.lower(), set()).add(contact.id)
 
-    def _validate_contacts(self, json_data: list[dict]) -> list[dict]:
+    def _unindex_contact(self, contact: ContactModel) -> None:
+        """
+        Удаляет контакт из поискового индекса.
         """
-        Проверяет и корректирует валидность данных всех контактов.
+        for field, value in zip(self._INDEXED_FIELDS, self._INDEXED_VALUES(contact)):
+            field_index: dict[str, set[int]] = self._search_index[field]
+            key: str = value.lower()
+            field_index[key].discard(contact.id)
+            if not field_index[key]:
+                del field_index[key]
 
-        Принимает список словарей с данными контактов в формате JSON. Проверяет валидность данных
-        каждого контакта, убирает дубликаты и корректирует ID в случае дублирования.
-        Возвращает список валидных и корректных контактов.
+    def save_contact(self) -> None:
         """
-        result_data: list[dict] = []
-        invalid_data: list[dict] = []
-        processed_ids: list[int] = []
+        Сохраняет список контактов в файл 'self.filename'.
 
-        for contact in json_data:
-            valid: bool = True
-            if len(contact) == len(self._FIELD_TYPES):
-                for contact_key, contact_value in contact.items():
-                    if (contact_key not in self._FIELD_TYPES or not isinstance(contact_value,
-                                                                               self._FIELD_TYPES[contact_key])):
-                        valid = False
-                        break
-            else:
-                continue
+        Преобразует список контактов в формат JSON и записывает его одной операцией записи во временный
+        файл, который затем атомарно заменяет 'self.filename', после чего удаляет журнал изменений.
+        Если программа завершится во время записи, прежний файл останется целым. Если с момента
+        последнего сохранения контакты не менялись, ничего не делает.
+        """
+        if not self._dirty:
+            return
+        tmp_filename: str = f'{self._filename}.tmp'
+        with open(tmp_filename, 'wb') as file:
+            file.write(self._CONTACTS_ADAPTER.dump_json(self._entries, indent=4))
+        os.replace(tmp_filename, self._filename)
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+        if os.path.exists(self._journal_filename):
+            os.remove(self._journal_filename)
+        self._dirty = False
+
+    def _append_journal(self, record: ContactModel | dict) -> None:
+        """
+        Дописывает запись об изменении в журнал 'self.journal_filename'.
 
-            if valid:
-                if contact['id'] not in processed_ids:
-                    result_data.append(contact)
-                    processed_ids.append(contact['id'])
-                else:
-                    invalid_data.append(contact)
+        Каждая запись занимает одну строку JSON: данные добавленного или изменённого контакта,
+        либо {'id': ..., 'deleted': True} для удалённого. Записывается только сама запись,
+        а не весь список контактов. Файл журнала открывается при первой записи и остаётся открытым
+        до сохранения. После каждой записи буфер сбрасывается в файл целиком.
+        """
+        if self._journal_file is None:
+            self._journal_file = open(self._journal_filename, 'ab')
+        self._journal_file.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        self._journal_file.flush()
 
-        if invalid_data:
-            max_id: int = max(processed_ids)
-            for index, contact in enumerate(invalid_data, start=1):
-                contact['id'] = int(max_id + index)
-                result_data.append(contact)
+    def _replay_journal(self) -> None:
+        """
+        Применяет к загруженным контактам изменения из журнала 'self.journal_filename'.
 
-        return result_data
+        Записи применяются по порядку, для каждого ID действует последняя запись. Невалидные строки
+        (например, недописанная при аварийном завершении) пропускаются. Если журнал существует,
+        контакты помечаются для сохранения, чтобы сразу после загрузки перенести журнал в основной файл
+        и не дописывать новые записи после недописанной строки.
+        """
+        if not os.path.exists(self._journal_filename):
+            return
+        with open(self._journal_filename, 'rb') as journal_file:
+            for line in journal_file:
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+
+                if record.keys() == self._TOMBSTONE_KEYS:
+                    if type(record['id']) is not int or record['deleted'] is not True:
+                        continue
+                    contact = self._by_id.pop(record['id'], None)
+                    if contact:
+                        self._entries.remove(contact)
+                else:
+                    try:
+                        updated_contact: ContactModel = self._CONTACT_ADAPTER.validate_python(record)
+                    except ValidationError:
+                        continue
+                    contact = self._by_id.get(updated_contact.id)
+                    if contact:
+                        for field, value in record.items():
+                            setattr(contact, field, value)
+                    else:
+                        self._entries.append(updated_contact)
+                        self._by_id[updated_contact.id] = updated_contact
+        self._dirty = True
 
     def _load_contacts(self) -> None:
         """
         Загружает контакты из файла 'contacts.json' в список.
 
-        Если файл существует, читает из него данные контактов, проверяет их валидность и загружает
-        в список контактов.
+        Если файл существует, читает из него данные контактов и проверяет их валидность с помощью ContactModel:
+        сначала весь список одним вызовом TypeAdapter, а если в нём есть невалидные контакты, то по одному,
+        отбрасывая невалидные. За один проход заполняет список контактов и индекс по ID, а дубликатам ID
+        назначает новые ID после максимального. Затем применяет несохранённые изменения из журнала,
+        сортирует список по ID и, если журнал был, сохраняет контакты и удаляет журнал.
         """
         if os.path.exists(self._filename):
-            with open(self._filename) as json_file:
-                contacts_json: list[dict] = json.load(json_file)
-            result_contacts: list[dict] = self._validate_contacts(contacts_json)
-            self._entries.extend([ContactModel(**contact) for contact in result_contacts])
+            with open(self._filename, 'rb') as json_file:
+                contacts_json: list[dict] = orjson.loads(json_file.read())
+
+            try:
+                contacts: list[ContactModel] = self._CONTACTS_ADAPTER.validate_python(contacts_json)
+            except ValidationError:
+                contacts = []
+                validate_contact = self._CONTACT_ADAPTER.validate_python
+                for contact_data in contacts_json:
+                    try:
+                        contacts.append(validate_contact(contact_data))
+                    except ValidationError:
+                        continue
+            del contacts_json
+
+            duplicates: list[ContactModel] = []
+            max_id: int = 0
+            for contact in contacts:
+                if contact.id in self._by_id:
+                    duplicates.append(contact)
+                    continue
+                self._entries.append(contact)
+                self._by_id[contact.id] = contact
+                if contact.id > max_id:
+                    max_id = contact.id
+
+            for index, contact in enumerate(duplicates, start=1):
+                contact.id = max_id + index
+                self._entries.append(contact)
+                self._by_id[contact.id] = contact
+
+        self._replay_journal()
+        self._sort_contacts()
+        for contact in self._entries:
+            self._index_contact(contact)
+        self.save_contact()
 
     def remove_contact(self) -> None:
         """
         Удаляет контакт из записной книжки по его ID.
 
         Запрашивает у пользователя ввод ID контакта, который нужно удалить. Если контакт с указанным ID существует,
-        удаляет его из записной книжки и сохраняет изменения. Если контакт не найден или введен неверный формат ID,
-        выводит соответствующие сообщения.
+        удаляет его из записной книжки и записывает удаление в журнал изменений. Если контакт не найден или введен
+        неверный формат ID, выводит соответствующие сообщения.
 
         """
-        contact_id: str = input('Введите id: ').strip()
-        if contact_id.isdigit():
-            contact = self._get_contact_by_id(int(contact_id))
-            if contact:
-                self._entries.remove(contact)
-                self.save_contact()
-                print('Контакт успешно удален')
-            else:
-                print('Такого контакта нет')
-        else:
+        contact_id: int | None = self._parse_id(input('Введите id: ').strip())
+        if contact_id is None:
             print('Неверный формат')
+            return
+
+        contact = self._get_contact_by_id(contact_id)
+        if contact:
+            del self._entries[bisect_left(self._entries, contact.id, key=attrgetter('id'))]
+            del self._by_id[contact.id]
+            self._unindex_contact(contact)
+            self._shrink_columns(contact)
+            self._row_cache.pop(contact.id, None)
+            self._page_cache.clear()
+            self._append_journal({'id': contact.id, 'deleted': True})
+            self._dirty = True
+            print('Контакт успешно удален')
+        else:
+            print('Такого контакта нет')
 
     def add_contact(self) -> None:
         """
         Добавляет новый контакт в записную книжку.
 
         Запрашивает у пользователя информацию о контакте и проверяет её на валидность. Если данные валидны,
-        создаёт экземпляр класса ContactModel и добавляет его в список контактов. Затем сохраняет контакты
-        в файл.
+        создаёт экземпляр класса ContactModel, добавляет его в список контактов и записывает в журнал
+        изменений.
         """
         contact_data = {
             'id': self._next_id,
@@ -164,13 +371,20 @@ class PhoneBook:
             'personal_phone': input('Личный телефон: ')
         }
 
-        if self._validate_contact(contact_data):
-            self._entries.append(ContactModel(**contact_data))
-            self.save_contact()
+        try:
+            contact: ContactModel = ContactModel(**contact_data)
+        except ValidationError:
+            print('\nДанные неверны')
+        else:
+            self._entries.append(contact)
+            self._by_id[contact.id] = contact
+            self._index_contact(contact)
+            self._page_cache.clear()
+            self._widen_columns(contact)
+            self._append_journal(contact)
+            self._dirty = True
             self._next_id += 1
             print('\nКонтакт успешно добавлен')
-        else:
-            print('\nДанные неверны')
 
     @staticmethod
     def _get_contact_data(contact: ContactModel) -> dict:
@@ -194,48 +408,63 @@ class PhoneBook:
                 f'Личный телефон (по умолчанию: {contact.personal_phone}): ').strip() or contact.personal_phone
         }
 
+    @staticmethod
+    def _parse_id(value: str) -> int | None:
+        """
+        Преобразует введённое значение в ID контакта или номер страницы.
+
+        Принимает только неотрицательное целое число из цифр 0-9 без знака, пробелов, подчёркиваний
+        и ведущих нулей (например, '007', '+7', '-7' и '1_0' отклоняются). Иначе возвращает None.
+        """
+        if not (value.isascii() and value.isdecimal()) or (value[0] == '0' and value != '0'):
+            return None
+        return int(value)
+
     def _get_contact_by_id(self, contact_id: int) -> ContactModel | None:
         """
         Возвращает контакт по его ID.
         """
-        for contact in self._entries:
-            if contact.id == contact_id:
-                return contact
+        return self._by_id.get(contact_id)
 
     def edit_contact(self) -> None:
         """
         Позволяет пользователю изменить информацию о существующем контакте.
 
         Пользователь вводит номер контакта, затем программа выводит информацию о контакте и предлагает внести
-        изменения. После внесения изменений, обновляет информацию о контакте и сохраняет изменения.
+        изменения. После внесения изменений, обновляет информацию о контакте и записывает её в журнал изменений.
         """
         while True:
             contact_id: str = input('Введите номер контакта, или "q" для выхода: ')
             if contact_id.lower() == 'q':
                 break
-            elif contact_id.isdigit():
-                contact = self._get_contact_by_id(int(contact_id))
-                if contact:
-                    self._print_tabulate([contact.model_dump_table()])
-
-                    updated_contact: ContactModel = contact.model_copy(
-                        update=self._get_contact_data(contact)
-                    )
-                    self._entries.remove(contact)
-                    self._entries.append(updated_contact)
-                    self._sort_contacts()
-                    self.save_contact()
-                    print('\nКонтакт успешно изменен')
-                    break
-                else:
-                    print('\nТакого контакта нет')
-                    break
-            else:
+            parsed_id: int | None = self._parse_id(contact_id)
+            if parsed_id is None:
                 print('\nНеверный формат')
                 continue
+            contact = self._get_contact_by_id(parsed_id)
 
-    @staticmethod
-    def _get_search_fields() -> list[int]:
+            if contact:
+                self._print_tabulate([self._get_table_row(contact)])
+
+                contact_data: dict = self._get_contact_data(contact)
+                self._unindex_contact(contact)
+                self._shrink_columns(contact)
+                self._row_cache.pop(contact.id, None)
+                self._page_cache.clear()
+                for field, value in contact_data.items():
+                    setattr(contact, field, value)
+                self._index_contact(contact)
+                self._widen_columns(contact)
+                self._append_journal(contact)
+                self._dirty = True
+                print('\nКонтакт успешно изменен')
+                break
+            else:
+                print('\nТакого контакта нет')
+                break
+
+    @classmethod
+    def _get_search_fields(cls) -> list[int]:
         """
         Запрашивает у пользователя номера полей для поиска.
 
@@ -252,8 +481,9 @@ class PhoneBook:
             7: личный телефон"""
               )
         user_input: str = input('Введите номера через запятую: ')
-        new_text: str = re.sub(r'[^1-7,]', '', user_input)
-        fields: list[int] = list(set(int(i) for i in new_text.split(',') if i.isdigit() and 1 <= int(i) <= 7))
+        new_text: str = ''.join(ch for ch in user_input if ch in cls._SEARCH_FIELDS_CHARS)
+        numbers: set[int] = {int(i) for i in new_text.split(',') if i.isdigit()}
+        fields: list[int] = [number for number in numbers if 1 <= number <= 7]
 
         return fields
 
@@ -265,12 +495,12 @@ class PhoneBook:
         соответствующие значения и возвращает словарь с введенными значениями.
         """
         fields_values: dict = {}
-        contact_headers: list[str] = list(self._FIELD_TYPES.keys())
 
         for field in fields:
-            user_input: str = input(f'Введите {self._TABLE_HEADERS[field - 1]}: ').strip()
+            field_name, header = self._SEARCH_FIELDS[field]
+            user_input: str = input(f'Введите {header}: ').strip()
             if user_input:
-                fields_values[contact_headers[field - 1]] = user_input
+                fields_values[field_name] = user_input
 
         return fields_values
 
@@ -279,27 +509,34 @@ class PhoneBook:
         Позволяет пользователю выполнять поиск контактов по различным полям.
 
         Пользователь выбирает поля, по которым будет выполняться поиск, и вводит значения для этих полей.
+        ID должен совпадать полностью, текстовые поля ищутся по вхождению подстроки без учёта регистра.
         Программа выводит список контактов, удовлетворяющих заданным критериям поиска.
         """
         while True:
             fields: list[int] = self._get_search_fields()
             if fields:
                 fields_values: dict = self._get_search_values(fields)
-                table_data: list = []
+                matched_sets: list[set[int]] = []
 
-                for contact in self._entries:
-                    match: bool = True
-                    for field, value in fields_values.items():
-                        if field == 'id':
-                            if str(contact.id) != value:
-                                match = False
-                                break
-                        else:
-                            if getattr(contact, field).lower() != value.lower():
-                                match = False
-                                break
-                    if match:
-                        table_data.append(contact.model_dump_table())
+                for field, value in fields_values.items():
+                    if field == 'id':
+                        contact_id: int | None = self._parse_id(value)
+                        matched_ids: set[int] = {contact_id} if contact_id in self._by_id else set()
+                    else:
+                        needle: str = value.lower()
+                        matched_ids = set().union(*(contact_ids for field_value, contact_ids
+                                                    in self._search_index[field].items() if needle in field_value))
+                    matched_sets.append(matched_ids)
+                    if not matched_ids:
+                        break
+
+                if matched_sets:
+                    matched_sets.sort(key=len)
+                    found_ids: set[int] = set.intersection(*matched_sets)
+                else:
+                    found_ids = set(self._by_id)
+                table_data: list = [self._get_table_row(self._by_id[contact_id])
+                                    for contact_id in sorted(found_ids)]
                 if table_data:
                     self._print_tabulate(table_data)
                     break
@@ -316,7 +553,8 @@ class PhoneBook:
         Отображает список контактов в виде таблицы на нескольких страницах.
 
         Выводит список контактов в виде таблицы с заданным количеством контактов на странице. Пользователь
-        может переходить между страницами, просматривая все контакты.
+        может переходить между страницами, просматривая все контакты. Отрисованные страницы кешируются
+        до следующего изменения контактов.
         """
 
         page: int = 1
@@ -326,14 +564,16 @@ class PhoneBook:
             try:
                 print(f'\nСтраница {page}/{total_pages}')
 
-                start_index: int = (page - 1) * page_size
-                end_index: int = start_index + page_size
+                page_table: str | None = self._page_cache.get((page_size, page))
+                if page_table is None:
+                    start_index: int = (page - 1) * page_size
+                    end_index: int = start_index + page_size
 
-                table_data: list = []
-                for index, contact in enumerate(self._entries[start_index:end_index], start=start_index):
-                    table_data.append(contact.model_dump_table())
+                    table_data: list = [self._get_table_row(contact)
+                                        for contact in self._entries[start_index:end_index]]
+                    page_table = self._page_cache[(page_size, page)] = self._render_page(table_data)
 
-                self._print_tabulate(table_data)
+                print(page_table)
                 print(
                     "Для перехода на следующую страницу, нажмите 'n'. Для перехода на предыдущую страницу, нажмите 'b'. Для выхода, нажмите 'q'. Чтобы перейти на конкретную страницу, укажите её номер.")
 
@@ -345,13 +585,15 @@ class PhoneBook:
                     page = (page % total_pages) + 1
                 elif user_input.lower() == 'b':
                     page = (page - 2) % total_pages + 1
-                elif user_input.isdigit():
-                    if 1 <= int(user_input) <= total_pages:
-                        page = int(user_input)
+                else:
+                    page_number: int | None = self._parse_id(user_input)
+                    if page_number is None:
+                        print("Неправильный формат!")
+                        continue
+                    if 1 <= page_number <= total_pages:
+                        page = page_number
                     else:
                         print('Такой страницы нет!')
-                else:
-                    print("Неправильный формат!")
             except ZeroDivisionError:
                 print('У вас одна страница')
                 continue
@@ -362,6 +604,7 @@ def main() -> None:
     Основная функция для запуска консольной программы управления контактами.
     """
     contacts: PhoneBook = PhoneBook('contacts.json')
+    atexit.register(contacts.save_contact)
 
     while True:
         print('\nЗаписная книжка:')
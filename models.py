@@ -1,14 +1,16 @@
-from pydantic import BaseModel
+from pydantic import ConfigDict, StrictInt, StrictStr
+from pydantic.dataclasses import dataclass
 
 
-class ContactModel(BaseModel):
-    id: int
-    first_name: str
-    last_name: str
-    middle_name: str
-    organization: str
-    work_phone: str
-    personal_phone: str
+@dataclass(slots=True, config=ConfigDict(extra='forbid'))
+class ContactModel:
+    id: StrictInt
+    first_name: StrictStr
+    last_name: StrictStr
+    middle_name: StrictStr
+    organization: StrictStr
+    work_phone: StrictStr
+    personal_phone: StrictStr
 
     def model_dump_table(self) -> list:
         return [self.id, self.first_name, self.last_name, self.middle_name,